@@ -30,7 +30,7 @@ class Visibility(str, Enum):
     INTERNAL = "internal"
 
 
-@dataclass
+@dataclass(slots=True)
 class FunctionInfo:
     """Information about a function/method."""
     name: str
@@ -47,7 +47,7 @@ class FunctionInfo:
     complexity: Optional[int] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class ClassInfo:
     """Information about a class."""
     name: str
@@ -62,7 +62,7 @@ class ClassInfo:
     line_end: Optional[int] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class ModuleInfo:
     """Information about a module/namespace."""
     name: str
@@ -75,7 +75,7 @@ class ModuleInfo:
     dependencies: List[str] = field(default_factory=list)
 
 
-@dataclass
+@dataclass(slots=True)
 class FileInfo:
     """Information about a source code file."""
     path: str
@@ -89,7 +89,7 @@ class FileInfo:
     is_test_file: bool = False
 
 
-@dataclass
+@dataclass(slots=True)
 class LanguageInfo:
     """Information about languages detected in the project."""
     language: LanguageType
@@ -99,7 +99,7 @@ class LanguageInfo:
     percentage: float = 0.0
 
 
-@dataclass
+@dataclass(slots=True)
 class ProjectStructure:
     """Complete project structure representation."""
     root_path: str
@@ -111,7 +111,7 @@ class ProjectStructure:
     metadata: Dict[str, Any] = field(default_factory=dict)
 
 
-@dataclass
+@dataclass(slots=True)
 class CodeStructure:
     """Unified code structure container."""
     project: ProjectStructure
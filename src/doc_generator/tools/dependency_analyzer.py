@@ -1,10 +1,169 @@
 """Dependency analysis tool."""
 
+import ast
+import heapq
+import io
+import os
+import pickle
+import re
+import sys
+import threading
+from itertools import islice
 from pathlib import Path
-from typing import Dict, List, Set
+from typing import Dict, List, Optional, Set, Tuple
 from crewai.tools import BaseTool
 from pydantic import BaseModel, Field
 
+from doc_generator.tools.filesystem import CACHE_DIR, walk_files
+from doc_generator.tools.parallel import map_files
+from doc_generator.tools.python_ast import BLOCK_FIELDS
+
+
+# Directories never scanned for source files
+SKIP_DIRS = frozenset({'.git', '__pycache__', 'node_modules', '.venv', 'venv'})
+
+# Import prefixes treated as project-internal modules
+LOCAL_PREFIXES = ('src', 'lib', 'utils', 'core')
+
+# Anything that could start an import statement (line start, or after ';'/':')
+_IMPORT_RE = re.compile(rb'(?:^|[;:])[ \t\f]*(?:import|from)[ \t\f.\\]', re.MULTILINE)
+
+# Start of a new column-0 statement that cannot continue an open block
+_TOP_LEVEL_RE = re.compile(rb'^(?![\s#)\]}]|(?:except|else|elif|finally)\b)', re.MULTILINE)
+
+
+# Persistent import cache: abs path -> (mtime_ns, size, imports)
+IMPORT_CACHE_FILE = CACHE_DIR / 'py_imports.pkl' if CACHE_DIR is not None else None
+_IMPORT_CACHE_VERSION = 6
+
+# Grammar changes between Python versions alter what parses, so entries are
+# only valid for the interpreter that wrote them
+_IMPORT_CACHE_TAG = (_IMPORT_CACHE_VERSION, sys.version_info[:2])
+
+_import_cache: Optional[Dict[str, Tuple[int, int, List[str]]]] = None
+
+# Guards _import_cache and its file; analyses may run in several threads
+_import_cache_lock = threading.Lock()
+
+
+def _load_import_cache() -> Dict[str, Tuple[int, int, List[str]]]:
+    """Load the import cache from disk once per process.
+
+    Callers must hold _import_cache_lock.
+    """
+    global _import_cache
+    if _import_cache is None:
+        _import_cache = {}
+        if IMPORT_CACHE_FILE is not None:
+            try:
+                with open(IMPORT_CACHE_FILE, 'rb') as f:
+                    version, entries = pickle.load(f)
+                if version == _IMPORT_CACHE_TAG:
+                    _import_cache = entries
+            except Exception:
+                pass
+    return _import_cache
+
+
+def _save_import_cache(cache: Dict[str, Tuple[int, int, List[str]]]) -> None:
+    """Atomically persist the import cache; failures are non-fatal.
+
+    Callers must hold _import_cache_lock.
+    """
+    if IMPORT_CACHE_FILE is None:
+        return
+    tmp_file = IMPORT_CACHE_FILE.with_name(f"{IMPORT_CACHE_FILE.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+    try:
+        IMPORT_CACHE_FILE.parent.mkdir(parents=True, exist_ok=True)
+        with open(tmp_file, 'wb') as f:
+            pickle.dump((_IMPORT_CACHE_TAG, cache), f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp_file, IMPORT_CACHE_FILE)
+    except Exception:
+        try:
+            os.remove(tmp_file)
+        except OSError:
+            pass
+
+
+def _collect_imports(body: List[ast.stmt], file_deps: List[str]) -> None:
+    """Collect module-level imports, including those in nested blocks.
+
+    Conditional imports (TYPE_CHECKING, version checks), optional-dependency
+    fallbacks and imports under with/for/match blocks all run at import
+    time; function and class bodies are skipped.
+    """
+    for node in body:
+        node_type = type(node)
+        if node_type is ast.Import:
+            file_deps.extend(alias.name for alias in node.names)
+        elif node_type is ast.ImportFrom:
+            if node.module:
+                file_deps.append(node.module)
+        else:
+            for field in BLOCK_FIELDS.get(node_type, ()):
+                _collect_imports(getattr(node, field), file_deps)
+
+
+def _parse_bytes(source: bytes, filename: str) -> ast.Module:
+    """Parse raw source, falling back to lossy UTF-8 for undecodable bytes.
+
+    Parsing bytes honours PEP 263 coding declarations, but a stray byte that
+    is invalid in the declared encoding fails the whole file; decoding with
+    errors ignored still recovers its imports.
+    """
+    try:
+        return ast.parse(source, filename=filename)
+    except (SyntaxError, ValueError):
+        return ast.parse(source.decode('utf-8', errors='ignore'), filename=filename)
+
+
+def _parse_python_imports(py_file: str) -> Optional[List[str]]:
+    """Return the imports of a single Python file, or None if it can't be read.
+
+    Module-level so it can be pickled into worker processes.
+    """
+    try:
+        with open(py_file, 'rb') as f:
+            content = f.read()
+    except OSError:
+        return None
+    
+    try:
+        # The patterns below anchor on LF; the tokenizer also ends lines at
+        # CRLF and a lone CR, so normalize those first
+        if b'\r' in content:
+            content = content.replace(b'\r\n', b'\n').replace(b'\r', b'\n')
+        
+        last_import = None
+        for last_import in _IMPORT_RE.finditer(content):
+            pass
+        
+        # Files without a single import line need no parsing at all
+        if last_import is None:
+            return []
+        
+        # Only parse up to the first top-level statement after the last
+        # import; everything past it cannot contribute. A cut that lands
+        # inside a string or an open block fails to parse, in which case
+        # the whole file is parsed instead.
+        tree = None
+        line_end = content.find(b'\n', last_import.end())
+        boundary = _TOP_LEVEL_RE.search(content, line_end + 1) if line_end != -1 else None
+        if boundary is not None:
+            try:
+                tree = _parse_bytes(content[:boundary.start()], py_file)
+            except (SyntaxError, ValueError):
+                tree = None
+        if tree is None:
+            tree = _parse_bytes(content, py_file)
+    except Exception:
+        return []
+    
+    # Imports live at module level; skip function and class bodies
+    file_deps: List[str] = []
+    _collect_imports(tree.body, file_deps)
+    return file_deps
+
 
 class DependencyAnalyzerInput(BaseModel):
     """Input schema for DependencyAnalyzer."""
@@ -26,32 +185,55 @@ class DependencyAnalyzer(BaseTool):
         """Analyze Python dependencies."""
         dependencies: Dict[str, List[str]] = {}
         
-        for py_file in folder.rglob("*.py"):
-            if any(part in {'.git', '__pycache__', 'node_modules', '.venv', 'venv'} for part in py_file.parts):
+        root = os.path.abspath(folder)
+        root_prefix = os.path.join(root, '')
+        prefix_len = len(root_prefix)
+        
+        found: List[Tuple[str, int, int]] = []
+        for entry in walk_files(root, SKIP_DIRS):
+            if not entry.name.endswith('.py'):
                 continue
-            
             try:
-                with open(py_file, 'r', encoding='utf-8', errors='ignore') as f:
-                    content = f.read()
-                
-                import ast
-                tree = ast.parse(content, filename=str(py_file))
-                
-                file_deps = []
-                for node in ast.walk(tree):
-                    if isinstance(node, ast.Import):
-                        for alias in node.names:
-                            file_deps.append(alias.name)
-                    elif isinstance(node, ast.ImportFrom):
-                        if node.module:
-                            file_deps.append(node.module)
-                
-                if file_deps:
-                    rel_path = str(py_file.relative_to(folder))
-                    dependencies[rel_path] = file_deps
-                    
-            except Exception:
+                st = entry.stat()
+            except OSError:
                 continue
+            found.append((entry.path, st.st_mtime_ns, st.st_size))
+        
+        # Reuse cached imports for files unchanged since the last analysis
+        file_imports: Dict[str, List[str]] = {}
+        stale: List[Tuple[str, int, int]] = []
+        with _import_cache_lock:
+            cache = _load_import_cache()
+            for path, mtime_ns, size in found:
+                cached = cache.get(path)
+                if cached is not None and cached[0] == mtime_ns and cached[1] == size:
+                    file_imports[path] = cached[2]
+                else:
+                    file_imports[path] = []
+                    stale.append((path, mtime_ns, size))
+            
+            # Forget files under this folder that have since been deleted or skipped
+            removed = [path for path in cache if path.startswith(root_prefix) and path not in file_imports]
+            for path in removed:
+                del cache[path]
+        
+        if stale:
+            # Parsing is CPU-bound and independent per file, so fan out across cores
+            results = map_files(_parse_python_imports, [path for path, _, _ in stale])
+            with _import_cache_lock:
+                for (path, mtime_ns, size), file_deps in zip(stale, results):
+                    # Unreadable files are retried on the next analysis
+                    if file_deps is not None:
+                        file_imports[path] = file_deps
+                        cache[path] = (mtime_ns, size, file_deps)
+                _save_import_cache(cache)
+        elif removed:
+            with _import_cache_lock:
+                _save_import_cache(cache)
+        
+        for path, file_deps in file_imports.items():
+            if file_deps:
+                dependencies[path[prefix_len:]] = file_deps
         
         return dependencies
 
@@ -65,15 +247,6 @@ class DependencyAnalyzer(BaseTool):
             # Analyze Python dependencies
             dependencies = self._analyze_python_dependencies(folder)
             
-            # Build result
-            result = [
-                "=" * 70,
-                "DEPENDENCY ANALYSIS",
-                "=" * 70,
-                f"\nAnalyzed: {folder_path}",
-                f"Files with dependencies: {len(dependencies)}",
-            ]
-            
             # Count dependency types
             external_deps: Set[str] = set()
             internal_deps: Set[str] = set()
@@ -81,29 +254,37 @@ class DependencyAnalyzer(BaseTool):
             for file_path, deps in dependencies.items():
                 for dep in deps:
                     # Check if it's an external dependency (not a local module)
-                    if not any(dep.startswith(local) for local in ['src', 'lib', 'utils', 'core']):
+                    if not dep.startswith(LOCAL_PREFIXES):
                         external_deps.add(dep.split('.')[0])
                     else:
                         internal_deps.add(dep)
             
-            result.append(f"\nExternal Dependencies: {len(external_deps)}")
-            for dep in sorted(external_deps)[:20]:
-                result.append(f"  - {dep}")
+            # Build result in a single buffer
+            buf = io.StringIO()
+            write = buf.write
+            write("=" * 70 + "\n")
+            write("DEPENDENCY ANALYSIS\n")
+            write("=" * 70 + "\n")
+            write(f"\nAnalyzed: {folder_path}\n")
+            write(f"Files with dependencies: {len(dependencies)}\n")
+            
+            write(f"\nExternal Dependencies: {len(external_deps)}\n")
+            for dep in heapq.nsmallest(20, external_deps):
+                write(f"  - {dep}\n")
             if len(external_deps) > 20:
-                result.append(f"  ... and {len(external_deps) - 20} more")
+                write(f"  ... and {len(external_deps) - 20} more\n")
             
-            result.append(f"\nInternal Dependencies: {len(internal_deps)}")
-            result.append("\nSample dependency relationships:")
-            for file_path, deps in list(dependencies.items())[:10]:
-                result.append(f"\n  {file_path}:")
-                for dep in deps[:5]:
-                    result.append(f"    → {dep}")
+            write(f"\nInternal Dependencies: {len(internal_deps)}\n")
+            write("\nSample dependency relationships:\n")
+            for file_path, deps in islice(dependencies.items(), 10):
+                write(f"\n  {file_path}:\n")
+                write("".join(f"    → {dep}\n" for dep in deps[:5]))
                 if len(deps) > 5:
-                    result.append(f"    ... and {len(deps) - 5} more")
+                    write(f"    ... and {len(deps) - 5} more\n")
             
-            result.append("\n" + "=" * 70)
+            write("\n" + "=" * 70)
             
-            return "\n".join(result)
+            return buf.getvalue()
             
         except Exception as e:
             return f"Error during dependency analysis: {str(e)}"
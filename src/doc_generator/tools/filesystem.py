@@ -0,0 +1,66 @@
+"""Filesystem helpers shared by the analysis tools."""
+
+import os
+from pathlib import Path
+from typing import AbstractSet, Iterator, Optional
+
+
+def _default_cache_dir() -> Optional[Path]:
+    """Return the cache root, or None if no location can be determined."""
+    cache_dir = os.getenv('DOCGEN_CACHE_DIR')
+    if cache_dir is not None:
+        return Path(cache_dir)
+    try:
+        return Path.home() / '.cache' / 'doc_generator'
+    except (RuntimeError, KeyError):
+        # No HOME and no passwd entry, e.g. arbitrary-UID containers
+        return None
+
+
+# Root for persistent analysis caches (override with DOCGEN_CACHE_DIR);
+# None disables them
+CACHE_DIR = _default_cache_dir()
+
+# Files larger than this are not read; their line count is estimated
+MAX_SCAN_BYTES = 2_000_000
+
+# Average source line length used for size-based line estimates
+BYTES_PER_LINE_ESTIMATE = 40
+
+# A NUL byte within this many leading bytes marks a file as binary
+BINARY_SNIFF_BYTES = 8192
+
+
+def estimate_line_count(size_bytes: int) -> int:
+    """Estimate the line count of a file too large to scan."""
+    return size_bytes // BYTES_PER_LINE_ESTIMATE
+
+
+def walk_files(root: str, skip_dirs: AbstractSet[str]) -> Iterator[os.DirEntry]:
+    """Recursively yield file entries under root using os.scandir.
+
+    Directories named in skip_dirs are pruned before they are entered and
+    symlinked directories are not followed. Files of a directory are yielded
+    before its subdirectories are visited, matching os.walk's top-down order.
+    Unreadable directories are silently skipped.
+    """
+    try:
+        with os.scandir(root) as it:
+            entries = list(it)
+    except OSError:
+        return
+
+    subdirs = []
+    for entry in entries:
+        try:
+            is_dir = entry.is_dir()
+        except OSError:
+            is_dir = False
+        if is_dir:
+            if entry.name not in skip_dirs and not entry.is_symlink():
+                subdirs.append(entry.path)
+        else:
+            yield entry
+
+    for subdir in subdirs:
+        yield from walk_files(subdir, skip_dirs)
@@ -1,12 +1,20 @@
 """Language detection tool for codebase analysis."""
 
+import io
 import os
 from pathlib import Path
-from typing import Dict, List
+from typing import Dict, List, Optional, Tuple
 from crewai.tools import BaseTool
 from pydantic import BaseModel, Field
 
 from doc_generator.models.code_structure import LanguageType, LanguageInfo
+from doc_generator.tools.filesystem import (
+    BINARY_SNIFF_BYTES,
+    MAX_SCAN_BYTES,
+    estimate_line_count,
+    walk_files,
+)
+from doc_generator.tools.parallel import map_files
 
 
 class LanguageDetectorInput(BaseModel):
@@ -30,12 +38,57 @@ LANGUAGE_EXTENSIONS = {
     LanguageType.KOTLIN: ['.kt', '.kts'],
 }
 
+# Flattened extension -> language lookup
+EXT_TO_LANG: Dict[str, LanguageType] = {
+    ext: lang for lang, extensions in LANGUAGE_EXTENSIONS.items() for ext in extensions
+}
+
+# Directories never scanned for source files
+SKIP_DIRS = frozenset({
+    '.git', '__pycache__', 'node_modules', '.venv', 'venv', 'env', '.env',
+    'dist', 'build', '.pytest_cache', '.mypy_cache',
+})
+
+# Read size used when counting lines
+READ_CHUNK_SIZE = 1 << 16
+
 # Test file patterns
 TEST_PATTERNS = [
     'test', 'spec', '__test__', '__tests__', 'tests', 'testing'
 ]
 
 
+def _count_lines(path: str) -> Optional[int]:
+    """Count the lines of a source file, returning 0 if it can't be read.
+
+    Counts line-ending bytes in fixed-size binary chunks rather than decoding
+    and iterating text lines. As with universal newlines, LF, CRLF and a lone
+    CR each end one line; a final unterminated line still counts.
+    Returns None for binary files (a NUL byte near the start).
+    """
+    line_count = 0
+    last_chunk = b''
+    try:
+        with open(path, 'rb', buffering=0) as f:
+            while True:
+                chunk = f.read(READ_CHUNK_SIZE)
+                if not chunk:
+                    break
+                if not last_chunk and b'\0' in chunk[:BINARY_SNIFF_BYTES]:
+                    return None
+                line_count += chunk.count(b'\n') + chunk.count(b'\r') - chunk.count(b'\r\n')
+                # A CRLF split across chunks was counted once per half
+                if last_chunk.endswith(b'\r') and chunk.startswith(b'\n'):
+                    line_count -= 1
+                last_chunk = chunk
+    except OSError:
+        return 0
+    
+    if last_chunk and not last_chunk.endswith((b'\n', b'\r')):
+        line_count += 1
+    return line_count
+
+
 class LanguageDetector(BaseTool):
     """Detects and classifies programming languages in a codebase."""
     
@@ -62,54 +115,48 @@ class LanguageDetector(BaseTool):
             total_files = 0
             total_lines = 0
             
-            # Walk through the directory
-            for root, dirs, files in os.walk(folder):
-                # Skip common ignored directories
-                dirs[:] = [d for d in dirs if d not in {'.git', '__pycache__', 'node_modules', 
-                                                         '.venv', 'venv', 'env', '.env', 'dist', 
-                                                         'build', '.pytest_cache', '.mypy_cache'}]
-                
-                for file in files:
-                    file_path = Path(root) / file
-                    ext = file_path.suffix.lower()
-                    
-                    # Detect language by extension
-                    detected_lang = None
-                    for lang, extensions in LANGUAGE_EXTENSIONS.items():
-                        if ext in extensions:
-                            detected_lang = lang
-                            break
-                    
-                    if detected_lang:
-                        # Count lines
-                        try:
-                            with open(file_path, 'r', encoding='utf-8', errors='ignore') as f:
-                                line_count = sum(1 for _ in f)
-                        except Exception:
-                            line_count = 0
-                        
-                        if detected_lang not in language_stats:
-                            language_stats[detected_lang] = {
-                                'files': [],
-                                'total_lines': 0,
-                                'file_count': 0
-                            }
-                        
-                        language_stats[detected_lang]['files'].append(str(file_path.relative_to(folder)))
-                        language_stats[detected_lang]['total_lines'] += line_count
-                        language_stats[detected_lang]['file_count'] += 1
-                        total_files += 1
-                        total_lines += line_count
+            # Walk through the directory, pruning ignored directories
+            root = str(folder)
+            prefix_len = len(os.path.join(root, ''))
+            source_files: List[Tuple[LanguageType, str, int]] = []
+            for entry in walk_files(root, SKIP_DIRS):
+                # Detect language by extension
+                detected_lang = EXT_TO_LANG.get(os.path.splitext(entry.name)[1].lower())
+                if detected_lang:
+                    try:
+                        size = entry.stat().st_size
+                    except OSError:
+                        size = 0
+                    source_files.append((detected_lang, entry.path, size))
+            
+            # Count lines (in parallel for large trees); files too big to
+            # scan get a size-based estimate instead of being read
+            scan_paths = [path for _, path, size in source_files if size <= MAX_SCAN_BYTES]
+            scanned = dict(zip(scan_paths, map_files(_count_lines, scan_paths)))
+            estimated_files = 0
             
-            # Build result
-            result_lines = [
-                f"Language Detection Results for: {folder_path}",
-                f"=" * 60,
-                f"Total files analyzed: {total_files}",
-                f"Total lines of code: {total_lines:,}",
-                f"\nDetected Languages:",
-                f"-" * 60
-            ]
+            for detected_lang, path, size in source_files:
+                if size > MAX_SCAN_BYTES:
+                    line_count = estimate_line_count(size)
+                    estimated_files += 1
+                else:
+                    line_count = scanned[path]
+                    if line_count is None:
+                        # Binary content behind a source extension
+                        continue
+                
+                if detected_lang not in language_stats:
+                    language_stats[detected_lang] = {
+                        'files': [],
+                        'total_lines': 0,
+                        'file_count': 0
+                    }
+                
+                language_stats[detected_lang]['files'].append(path[prefix_len:])
+                language_stats[detected_lang]['total_lines'] += line_count
+                language_stats[detected_lang]['file_count'] += 1
+                total_files += 1
+                total_lines += line_count
             
             # Sort by file count
             sorted_langs = sorted(
@@ -118,21 +165,34 @@ class LanguageDetector(BaseTool):
                 reverse=True
             )
             
+            # Build result in a single buffer
+            buf = io.StringIO()
+            write = buf.write
+            write(f"Language Detection Results for: {folder_path}\n")
+            write("=" * 60 + "\n")
+            write(f"Total files analyzed: {total_files}\n")
+            write(f"Total lines of code: {total_lines:,}")
+            if estimated_files:
+                write(f"\n  (line counts estimated from size for {estimated_files} files over {MAX_SCAN_BYTES:,} bytes)")
+            write("\n\nDetected Languages:\n")
+            write("-" * 60)
+            
             for lang, stats in sorted_langs:
                 percentage = (stats['file_count'] / total_files * 100) if total_files > 0 else 0
-                result_lines.append(f"\n{lang.value.upper()}:")
-                result_lines.append(f"  Files: {stats['file_count']} ({percentage:.1f}%)")
-                result_lines.append(f"  Lines: {stats['total_lines']:,}")
-                result_lines.append(f"  Sample files (first 5):")
-                for file in stats['files'][:5]:
-                    result_lines.append(f"    - {file}")
+                write(
+                    f"\n\n{lang.value.upper()}:"
+                    f"\n  Files: {stats['file_count']} ({percentage:.1f}%)"
+                    f"\n  Lines: {stats['total_lines']:,}"
+                    f"\n  Sample files (first 5):"
+                )
+                write("".join(f"\n    - {file}" for file in stats['files'][:5]))
                 if len(stats['files']) > 5:
-                    result_lines.append(f"    ... and {len(stats['files']) - 5} more")
+                    write(f"\n    ... and {len(stats['files']) - 5} more")
             
             if not language_stats:
-                result_lines.append("\nNo supported programming languages detected.")
+                write("\n\nNo supported programming languages detected.")
             
-            return "\n".join(result_lines)
+            return buf.getvalue()
             
         except Exception as e:
             return f"Error during language detection: {str(e)}"
@@ -0,0 +1,27 @@
+"""Process-pool helpers for per-file analysis."""
+
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import Callable, List, Sequence, TypeVar
+
+T = TypeVar('T')
+R = TypeVar('R')
+
+# Below this many files, pool start-up costs more than it saves
+PARALLEL_THRESHOLD = 200
+
+
+def map_files(func: Callable[[T], R], items: Sequence[T], chunksize: int = 32) -> List[R]:
+    """Apply func to every item, preserving order.
+
+    Large batches are spread over a process pool; func must therefore be a
+    picklable module-level function. Small batches run in-process, as do
+    large ones where worker processes cannot be started.
+    """
+    if len(items) > PARALLEL_THRESHOLD:
+        try:
+            with ProcessPoolExecutor() as executor:
+                return list(executor.map(func, items, chunksize=chunksize))
+        except (OSError, BrokenProcessPool):
+            pass
+    return [func(item) for item in items]
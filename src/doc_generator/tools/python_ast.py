@@ -0,0 +1,22 @@
+"""Python AST helpers shared by the analysis tools."""
+
+import ast
+
+
+# Fields holding nested statements (or handlers/cases wrapping them) of
+# compound statements other than def/class, in the order ast.NodeVisitor
+# would visit them
+BLOCK_FIELDS = {
+    ast.If: ('body', 'orelse'),
+    ast.For: ('body', 'orelse'),
+    ast.AsyncFor: ('body', 'orelse'),
+    ast.While: ('body', 'orelse'),
+    ast.With: ('body',),
+    ast.AsyncWith: ('body',),
+    ast.Try: ('body', 'handlers', 'orelse', 'finalbody'),
+    ast.ExceptHandler: ('body',),
+    ast.Match: ('cases',),
+    ast.match_case: ('body',),
+}
+if hasattr(ast, 'TryStar'):
+    BLOCK_FIELDS[ast.TryStar] = ('body', 'handlers', 'orelse', 'finalbody')
@@ -1,9 +1,17 @@
 """Structural extraction tools for code analysis."""
 
+import io
 import os
 import ast
+import hashlib
+import pickle
+import re
+import sys
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Dict, List, Optional, Any
+from typing import Dict, List, Optional, Any, Tuple
 from crewai.tools import BaseTool
 from pydantic import BaseModel, Field
 
@@ -18,6 +26,390 @@ from doc_generator.models.code_structure import (
     LanguageInfo,
     CodeStructure,
 )
+from doc_generator.tools.filesystem import (
+    BINARY_SNIFF_BYTES,
+    CACHE_DIR,
+    MAX_SCAN_BYTES,
+    estimate_line_count,
+    walk_files,
+)
+from doc_generator.tools.parallel import PARALLEL_THRESHOLD, map_files
+from doc_generator.tools.python_ast import BLOCK_FIELDS
+
+
+# Extensions whose files are analyzed, by language
+EXT_TO_LANG: Dict[str, LanguageType] = {
+    '.py': LanguageType.PYTHON, '.pyw': LanguageType.PYTHON,
+    '.js': LanguageType.JAVASCRIPT, '.jsx': LanguageType.JAVASCRIPT, '.mjs': LanguageType.JAVASCRIPT,
+    '.ts': LanguageType.TYPESCRIPT, '.tsx': LanguageType.TYPESCRIPT,
+    '.java': LanguageType.JAVA,
+    '.go': LanguageType.GO,
+    '.rs': LanguageType.RUST,
+}
+
+# Directories never scanned for source files
+SKIP_DIRS = frozenset({
+    '.git', '__pycache__', 'node_modules', '.venv', 'venv', 'env', '.env',
+    'dist', 'build', '.pytest_cache', '.mypy_cache', '.idea', '.vscode',
+    'target', 'bin', 'obj',
+})
+
+# Common entry point file names, in reporting order
+ENTRY_POINT_FILES = (
+    'main.py', '__main__.py', 'app.py', 'run.py', 'server.py',
+    'index.js', 'main.js', 'app.js', 'server.js',
+    'main.ts', 'app.ts', 'index.ts',
+    'Main.java', 'Application.java',
+    'main.go', 'main.rs', 'main.cpp',
+)
+_ENTRY_POINT_RANK = {name: rank for rank, name in enumerate(ENTRY_POINT_FILES)}
+
+# Threads used to overlap per-file reads; file I/O releases the GIL
+READ_WORKERS = 32
+
+
+# Number of recently read Python sources kept in memory
+FILE_CACHE_SIZE = 256
+
+# Number of recently extracted Python modules kept in memory
+MODULE_CACHE_SIZE = 4096
+
+_MISSING = object()
+
+
+class _FileLRU:
+    """Thread-safe LRU of per-file values, valid while (mtime_ns, size) match."""
+    
+    def __init__(self, maxsize: int):
+        self.maxsize = maxsize
+        self._entries: "OrderedDict[str, Tuple[Tuple[int, int], Any]]" = OrderedDict()
+        self._lock = threading.Lock()
+    
+    def get(self, path: str, stamp: Tuple[int, int]) -> Any:
+        """Return the cached value for path, or _MISSING if absent or stale."""
+        with self._lock:
+            cached = self._entries.get(path)
+            if cached is None or cached[0] != stamp:
+                return _MISSING
+            self._entries.move_to_end(path)
+            return cached[1]
+    
+    def put(self, path: str, stamp: Tuple[int, int], value: Any) -> None:
+        """Store value for path, evicting the least recently used entries."""
+        with self._lock:
+            self._entries[path] = (stamp, value)
+            self._entries.move_to_end(path)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+
+# Decoded Python sources (None for binary files)
+_file_cache = _FileLRU(FILE_CACHE_SIZE)
+
+# Extracted ModuleInfo (None for unparsable files)
+_module_cache = _FileLRU(MODULE_CACHE_SIZE)
+
+
+def _read_file(path: str) -> Optional[str]:
+    """Return a file's text with newlines normalized.
+
+    Returns None for binary files (a NUL byte near the start), so that
+    generated artifacts with a source extension are not decoded into noise.
+    """
+    with open(path, 'rb') as f:
+        data = f.read()
+    if b'\0' in data[:BINARY_SNIFF_BYTES]:
+        return None
+    content = data.decode('utf-8', errors='ignore')
+    # Match text-mode universal newline handling
+    if '\r' in content:
+        content = content.replace('\r\n', '\n').replace('\r', '\n')
+    return content
+
+
+def _read_source(path: str, st: os.stat_result) -> Optional[str]:
+    """Return a Python file's text, reusing the cached copy while it is unchanged."""
+    stamp = (st.st_mtime_ns, st.st_size)
+    content = _file_cache.get(path, stamp)
+    if content is _MISSING:
+        content = _read_file(path)
+        _file_cache.put(path, stamp, content)
+    return content
+
+
+# Persistent ModuleInfo cache keyed by source hash (enable with DOCGEN_AST_CACHE=1).
+# It keeps one small pickle per distinct source text and is never pruned;
+# delete the directory to reclaim the space.
+AST_CACHE_DIR = CACHE_DIR / 'ast' if CACHE_DIR is not None else None
+AST_CACHE_ENABLED = os.getenv('DOCGEN_AST_CACHE') == '1' and AST_CACHE_DIR is not None
+_AST_CACHE_VERSION = 2
+
+
+def _ast_cache_key(content: str) -> str:
+    """Hash source text together with everything that affects extraction."""
+    digest = hashlib.sha256(f"{_AST_CACHE_VERSION}:{sys.version_info[:2]}:".encode())
+    digest.update(content.encode('utf-8'))
+    return digest.hexdigest()
+
+
+def _load_cached_module(key: str) -> Optional[ModuleInfo]:
+    """Load a cached ModuleInfo, or None on a miss or unreadable entry."""
+    try:
+        with open(AST_CACHE_DIR / f"{key}.pkl", 'rb') as f:
+            return pickle.load(f)
+    except Exception:
+        return None
+
+
+def _store_cached_module(key: str, module: ModuleInfo) -> None:
+    """Atomically persist a ModuleInfo; failures are non-fatal."""
+    try:
+        AST_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        cache_file = AST_CACHE_DIR / f"{key}.pkl"
+        tmp_file = cache_file.with_name(f"{cache_file.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+        with open(tmp_file, 'wb') as f:
+            pickle.dump(module, f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp_file, cache_file)
+    except OSError:
+        pass
+
+
+_FUNCTION_TYPES = (ast.FunctionDef, ast.AsyncFunctionDef)
+
+# Anything that could start an import, definition or module docstring
+_STRUCTURE_RE = re.compile(
+    r'(?:^|[;:])[ \t\f]*(?:import|from)[ \t\f.\\]'
+    r'|^[ \t\f]*(?:class|def|async)[ \t\f\\]'
+    r'|^[ \t\f]*[rRuUbBfF]{0,2}[\'"(]',
+    re.MULTILINE,
+)
+
+
+def _extract_module(path: str, content: Optional[str] = None) -> Optional[ModuleInfo]:
+    """Parse a Python file, consulting the AST cache if enabled.
+
+    The file is read unless its text is passed in. Module-level so it can
+    be pickled into worker processes.
+    """
+    file_path = Path(path)
+    if content is None:
+        try:
+            content = _read_source(path, os.stat(path))
+        except Exception:
+            return None
+        if content is None:
+            return None
+    
+    if not AST_CACHE_ENABLED:
+        return _parse_python_structure(file_path, content)
+    
+    key = _ast_cache_key(content)
+    module = _load_cached_module(key)
+    if module is not None:
+        # Identical sources share an entry; the location is per file
+        module.name = file_path.stem
+        module.path = str(file_path)
+        return module
+    
+    module = _parse_python_structure(file_path, content)
+    if module is not None:
+        _store_cached_module(key, module)
+    return module
+
+
+def _parse_python_structure(file_path: Path, content: str) -> Optional[ModuleInfo]:
+    """Extract structure from Python source using AST."""
+    try:
+        module = ModuleInfo(
+            name=file_path.stem,
+            path=str(file_path),
+            imports=[],
+            classes=[],
+            functions=[],
+        )
+        
+        # Sources that cannot contain anything extracted below (empty
+        # __init__.py files, plain constant modules) need no parse at all
+        if not _STRUCTURE_RE.search(content):
+            return module
+        
+        tree = ast.parse(content, filename=str(file_path))
+        
+        # Extract docstring
+        if ast.get_docstring(tree):
+            module.docstring = ast.get_docstring(tree)
+        
+        _collect_structure(tree.body, module, False)
+        
+        return module
+        
+    except Exception as e:
+        return None
+
+
+def _collect_structure(body: List[ast.AST], module: ModuleInfo, in_class: bool) -> None:
+    """Collect imports, classes and functions from a list of statements.
+
+    Only statement lists are descended into; expressions cannot contain
+    definitions or imports, so they are never walked. Functions nested in
+    a class (including inside its methods) are recorded as methods only.
+    """
+    for node in body:
+        node_type = type(node)
+        if node_type is ast.Import:
+            for alias in node.names:
+                module.imports.append(alias.name)
+        elif node_type is ast.ImportFrom:
+            module_name = node.module or ""
+            for alias in node.names:
+                module.imports.append(sys.intern(f"{module_name}.{alias.name}"))
+        elif node_type is ast.ClassDef:
+            class_info = ClassInfo(
+                name=node.name,
+                base_classes=[_get_node_name(base) for base in node.bases],
+                docstring=ast.get_docstring(node),
+                line_start=node.lineno,
+                line_end=node.end_lineno if hasattr(node, 'end_lineno') else None,
+            )
+            
+            # Extract methods
+            for item in node.body:
+                if type(item) in _FUNCTION_TYPES:
+                    class_info.methods.append(_extract_function(item))
+            
+            module.classes.append(class_info)
+            _collect_structure(node.body, module, True)
+        elif node_type in _FUNCTION_TYPES:
+            if not in_class:
+                module.functions.append(_extract_function(node))
+            _collect_structure(node.body, module, in_class)
+        else:
+            # Compound statements (if/for/while/with/try/match) may nest definitions
+            for field in BLOCK_FIELDS.get(node_type, ()):
+                _collect_structure(getattr(node, field), module, in_class)
+
+
+def _extract_function(node: ast.FunctionDef) -> FunctionInfo:
+    """Extract function information from AST node."""
+    params = []
+    for arg in node.args.args:
+        param_info = {
+            'name': arg.arg,
+            'type': _get_node_name(arg.annotation) if arg.annotation else None,
+        }
+        params.append(param_info)
+    
+    return_type = _get_node_name(node.returns) if node.returns else None
+    
+    decorators = [_get_node_name(d) for d in node.decorator_list]
+    
+    return FunctionInfo(
+        name=node.name,
+        parameters=params,
+        return_type=return_type,
+        docstring=ast.get_docstring(node),
+        is_async=isinstance(node, ast.AsyncFunctionDef),
+        decorators=decorators,
+        line_start=node.lineno,
+        line_end=node.end_lineno if hasattr(node, 'end_lineno') else None,
+    )
+
+
+def _get_node_name(node) -> str:
+    """Get string representation of AST node.
+
+    Identifiers come from the parser already interned; composed names are
+    interned here since the same annotations and bases recur across files.
+    """
+    if node is None:
+        return ""
+    if isinstance(node, ast.Name):
+        return node.id
+    elif isinstance(node, ast.Attribute):
+        return sys.intern(f"{_get_node_name(node.value)}.{node.attr}")
+    elif isinstance(node, ast.Constant):
+        return sys.intern(str(node.value))
+    else:
+        text = _annotation_source(node)
+        if text is None:
+            text = ast.unparse(node) if hasattr(ast, 'unparse') else str(node)
+        return sys.intern(text)
+
+
+def _annotation_source(node) -> Optional[str]:
+    """Render common annotation shapes exactly as ast.unparse would.
+
+    Covers names, attributes, subscripts, argument lists and ``X | Y``
+    unions without building an unparser per call. Returns None for
+    anything else, and the caller falls back to ast.unparse.
+    """
+    node_type = type(node)
+    if node_type is ast.Name:
+        return node.id
+    if node_type is ast.Attribute:
+        if type(node.value) not in (ast.Name, ast.Attribute, ast.Subscript):
+            return None
+        value = _annotation_source(node.value)
+        return None if value is None else f"{value}.{node.attr}"
+    if node_type is ast.Subscript:
+        # Anything else would need parentheses, e.g. (A | B)[int]
+        if type(node.value) not in (ast.Name, ast.Attribute, ast.Subscript):
+            return None
+        value = _annotation_source(node.value)
+        if value is None:
+            return None
+        index = node.slice
+        if type(index) is ast.Tuple:
+            # A tuple index is written without parentheses
+            if len(index.elts) < 2:
+                return None
+            inner = _annotation_sources(index.elts)
+        else:
+            inner = _annotation_source(index)
+        return None if inner is None else f"{value}[{inner}]"
+    if node_type is ast.List:
+        inner = _annotation_sources(node.elts)
+        return None if inner is None else f"[{inner}]"
+    if node_type is ast.BinOp:
+        # Left-nested unions need no parentheses; other shapes might
+        if type(node.op) is not ast.BitOr or type(node.right) is ast.BinOp:
+            return None
+        left = _annotation_source(node.left)
+        right = _annotation_source(node.right)
+        return None if left is None or right is None else f"{left} | {right}"
+    if node_type is ast.Constant:
+        value = node.value
+        if value is None or value is Ellipsis or type(value) in (bool, int):
+            return '...' if value is Ellipsis else repr(value)
+        # u'' strings keep their prefix in unparse output; leave them to it
+        if (
+            type(value) is str and node.kind is None
+            and value.isprintable() and not any(c in value for c in '\'"\\')
+        ):
+            return repr(value)
+    return None
+
+
+def _annotation_sources(nodes) -> Optional[str]:
+    """Render a comma-separated sequence, or None if any element is unsupported."""
+    parts = []
+    for item in nodes:
+        # Nested tuples and starred items are parenthesized by unparse
+        if type(item) is ast.Tuple:
+            return None
+        text = _annotation_source(item)
+        if text is None:
+            return None
+        parts.append(text)
+    return ", ".join(parts)
+
+
+def _is_test_path(path: str) -> bool:
+    """Whether a path looks like a test or spec file."""
+    lowered = path.lower()
+    # Plain substring checks beat a case-insensitive regex here; '__test__'
+    # needs no check of its own since it contains 'test'
+    return 'test' in lowered or 'spec' in lowered
 
 
 class StructureExtractorInput(BaseModel):
@@ -36,145 +428,64 @@ class StructureExtractor(BaseTool):
     )
     args_schema: type[BaseModel] = StructureExtractorInput
 
-    def _extract_python_structure(self, file_path: Path) -> Optional[ModuleInfo]:
-        """Extract structure from a Python file using AST."""
-        try:
-            with open(file_path, 'r', encoding='utf-8', errors='ignore') as f:
-                content = f.read()
-            
-            tree = ast.parse(content, filename=str(file_path))
-            
-            module = ModuleInfo(
-                name=file_path.stem,
-                path=str(file_path),
-                imports=[],
-                classes=[],
-                functions=[],
-            )
-            
-            # Extract docstring
-            if ast.get_docstring(tree):
-                module.docstring = ast.get_docstring(tree)
-            
-            # Use a visitor pattern to track context
-            extractor_ref = self  # Reference to outer class methods
-            
-            class StructureVisitor(ast.NodeVisitor):
-                def __init__(self, module_ref, extractor):
-                    self.module = module_ref
-                    self.extractor = extractor
-                    self.in_class = False
-                
-                def visit_Import(self, node):
-                    for alias in node.names:
-                        self.module.imports.append(alias.name)
-                    self.generic_visit(node)
-                
-                def visit_ImportFrom(self, node):
-                    module_name = node.module or ""
-                    for alias in node.names:
-                        self.module.imports.append(f"{module_name}.{alias.name}")
-                    self.generic_visit(node)
-                
-                def visit_ClassDef(self, node):
-                    class_info = ClassInfo(
-                        name=node.name,
-                        base_classes=[self.extractor._get_node_name(base) for base in node.bases],
-                        docstring=ast.get_docstring(node),
-                        line_start=node.lineno,
-                        line_end=node.end_lineno if hasattr(node, 'end_lineno') else None,
-                    )
-                    
-                    # Mark we're in a class
-                    old_in_class = self.in_class
-                    self.in_class = True
-                    
-                    # Extract methods
-                    for item in node.body:
-                        if isinstance(item, ast.FunctionDef) or isinstance(item, ast.AsyncFunctionDef):
-                            method = self.extractor._extract_function(item)
-                            class_info.methods.append(method)
-                    
-                    self.module.classes.append(class_info)
-                    self.generic_visit(node)
-                    self.in_class = old_in_class
-                
-                def visit_FunctionDef(self, node):
-                    if not self.in_class:
-                        func = self.extractor._extract_function(node)
-                        self.module.functions.append(func)
-                    self.generic_visit(node)
-                
-                def visit_AsyncFunctionDef(self, node):
-                    if not self.in_class:
-                        func = self.extractor._extract_function(node)
-                        self.module.functions.append(func)
-                    self.generic_visit(node)
-            
-            visitor = StructureVisitor(module, extractor_ref)
-            visitor.visit(tree)
-            
-            return module
+    def _analyze_file(
+        self,
+        path: str,
+        rel_path: str,
+        name: str,
+        detected_lang: LanguageType,
+        st: os.stat_result,
+        keep_source: bool,
+    ) -> Tuple[Optional[FileInfo], Optional[Tuple[int, int]], Optional[str]]:
+        """Read a single source file and build its FileInfo.
+
+        The FileInfo is None for binary files. Files over MAX_SCAN_BYTES are
+        not read; their line count is estimated and no structure is
+        extracted. Python modules come from the in-process cache; on a miss
+        the file's (mtime_ns, size) stamp is returned so the caller can parse
+        it and cache the result, along with its text if keep_source is set.
+        """
+        size = st.st_size
+        module = None
+        pending_stamp = None
+        pending_source = None
+        content = None
+        if size > MAX_SCAN_BYTES:
+            line_count = estimate_line_count(size)
+        else:
+            is_python = detected_lang == LanguageType.PYTHON
+            try:
+                # Only Python sources are read again, so only they are cached
+                content = _read_source(path, st) if is_python else _read_file(path)
+                if content is None:
+                    return None, None, None
+                # Same count readlines() gives, without a str object per line
+                line_count = content.count('\n')
+                if content and not content.endswith('\n'):
+                    line_count += 1
+            except Exception:
+                line_count = 0
             
-        except Exception as e:
-            return None
-    
-    def _extract_function(self, node: ast.FunctionDef) -> FunctionInfo:
-        """Extract function information from AST node."""
-        params = []
-        for arg in node.args.args:
-            param_info = {
-                'name': arg.arg,
-                'type': self._get_node_name(arg.annotation) if arg.annotation else None,
-            }
-            params.append(param_info)
+            # Extract structure (currently only Python)
+            if is_python:
+                stamp = (st.st_mtime_ns, st.st_size)
+                module = _module_cache.get(path, stamp)
+                if module is _MISSING:
+                    module = None
+                    pending_stamp = stamp
+                    if keep_source:
+                        pending_source = content
         
-        return_type = self._get_node_name(node.returns) if node.returns else None
-        
-        decorators = [self._get_node_name(d) for d in node.decorator_list]
-        
-        return FunctionInfo(
-            name=node.name,
-            parameters=params,
-            return_type=return_type,
-            docstring=ast.get_docstring(node),
-            is_async=isinstance(node, ast.AsyncFunctionDef),
-            decorators=decorators,
-            line_start=node.lineno,
-            line_end=node.end_lineno if hasattr(node, 'end_lineno') else None,
+        file_info = FileInfo(
+            path=rel_path,
+            name=name,
+            language=detected_lang,
+            size_bytes=size,
+            line_count=line_count,
+            module=module,
+            is_test_file=_is_test_path(path),
         )
-    
-    def _get_node_name(self, node) -> str:
-        """Get string representation of AST node."""
-        if node is None:
-            return ""
-        if isinstance(node, ast.Name):
-            return node.id
-        elif isinstance(node, ast.Attribute):
-            return f"{self._get_node_name(node.value)}.{node.attr}"
-        elif isinstance(node, ast.Constant):
-            return str(node.value)
-        else:
-            return ast.unparse(node) if hasattr(ast, 'unparse') else str(node)
-    
-    def _detect_entry_points(self, folder: Path) -> List[str]:
-        """Detect entry points in the project."""
-        entry_points = []
-        
-        # Common entry point files
-        entry_patterns = [
-            'main.py', '__main__.py', 'app.py', 'run.py', 'server.py',
-            'index.js', 'main.js', 'app.js', 'server.js',
-            'main.ts', 'app.ts', 'index.ts',
-            'Main.java', 'Application.java',
-            'main.go', 'main.rs', 'main.cpp',
-        ]
-        
-        for pattern in entry_patterns:
-            for file_path in folder.rglob(pattern):
-                entry_points.append(str(file_path.relative_to(folder)))
-        
-        return entry_points
+        return file_info, pending_stamp, pending_source
     
     def _run(self, folder_path: str) -> str:
         """Extract structure from the codebase."""
@@ -189,62 +500,62 @@ class StructureExtractor(BaseTool):
             language_stats: Dict[LanguageType, LanguageInfo] = {}
             files_by_lang: Dict[LanguageType, List[FileInfo]] = {}
             
-            # Walk through directory
-            for root, dirs, files in os.walk(folder):
-                # Skip ignored directories
-                dirs[:] = [d for d in dirs if d not in {'.git', '__pycache__', 'node_modules',
-                                                         '.venv', 'venv', 'env', '.env', 'dist',
-                                                         'build', '.pytest_cache', '.mypy_cache',
-                                                         '.idea', '.vscode', 'target', 'bin', 'obj'}]
+            # Walk through directory, pruning ignored directories
+            root = str(folder)
+            prefix_len = len(os.path.join(root, ''))
+            candidates: List[Tuple[str, str, str, LanguageType, os.stat_result]] = []
+            entry_points: List[Tuple[int, str]] = []
+            for entry in walk_files(root, SKIP_DIRS):
+                # Detect entry points in the same pass
+                rank = _ENTRY_POINT_RANK.get(entry.name)
+                if rank is not None:
+                    entry_points.append((rank, entry.path[prefix_len:]))
                 
-                for file in files:
-                    file_path = Path(root) / file
-                    ext = file_path.suffix.lower()
-                    
-                    # Detect language
-                    detected_lang = None
-                    for lang, extensions in {
-                        LanguageType.PYTHON: ['.py', '.pyw'],
-                        LanguageType.JAVASCRIPT: ['.js', '.jsx', '.mjs'],
-                        LanguageType.TYPESCRIPT: ['.ts', '.tsx'],
-                        LanguageType.JAVA: ['.java'],
-                        LanguageType.GO: ['.go'],
-                        LanguageType.RUST: ['.rs'],
-                    }.items():
-                        if ext in extensions:
-                            detected_lang = lang
-                            break
-                    
-                    if detected_lang:
-                        # Get file stats
-                        size = file_path.stat().st_size
-                        try:
-                            with open(file_path, 'r', encoding='utf-8', errors='ignore') as f:
-                                lines = f.readlines()
-                                line_count = len(lines)
-                        except Exception:
-                            line_count = 0
-                        
-                        # Extract structure (currently only Python)
-                        module = None
-                        if detected_lang == LanguageType.PYTHON:
-                            module = self._extract_python_structure(file_path)
-                        
-                        file_info = FileInfo(
-                            path=str(file_path.relative_to(folder)),
-                            name=file_path.name,
-                            language=detected_lang,
-                            size_bytes=size,
-                            line_count=line_count,
-                            module=module,
-                            is_test_file=any(pattern in str(file_path).lower() for pattern in ['test', 'spec', '__test__']),
-                        )
-                        
-                        project_structure.files.append(file_info)
-                        
-                        if detected_lang not in files_by_lang:
-                            files_by_lang[detected_lang] = []
-                        files_by_lang[detected_lang].append(file_info)
+                # Detect language; extensions are nearly always lowercase
+                # already, so only normalize on a miss
+                ext = os.path.splitext(entry.name)[1]
+                detected_lang = EXT_TO_LANG.get(ext) or EXT_TO_LANG.get(ext.lower())
+                
+                if detected_lang:
+                    # Get file stats from the directory entry
+                    try:
+                        st = entry.stat()
+                    except OSError:
+                        continue
+                    candidates.append((entry.path, entry.path[prefix_len:], entry.name, detected_lang, st))
+            
+            # Few enough Python files to parse in-process: keep the text
+            # read below rather than reading it again
+            python_count = sum(1 for item in candidates if item[3] == LanguageType.PYTHON)
+            keep_sources = python_count <= PARALLEL_THRESHOLD
+            
+            # Reading each file is independent, so overlap the I/O
+            with ThreadPoolExecutor(max_workers=READ_WORKERS) as executor:
+                results = list(executor.map(
+                    lambda item: self._analyze_file(*item, keep_sources), candidates
+                ))
+            
+            pending: List[Tuple[FileInfo, str, Tuple[int, int], Optional[str]]] = []
+            for (path, _, _, _, _), (file_info, pending_stamp, pending_source) in zip(candidates, results):
+                if file_info is None:
+                    continue
+                project_structure.files.append(file_info)
+                if pending_stamp is not None:
+                    pending.append((file_info, path, pending_stamp, pending_source))
+                
+                if file_info.language not in files_by_lang:
+                    files_by_lang[file_info.language] = []
+                files_by_lang[file_info.language].append(file_info)
+            
+            # Parse uncached Python files; parsing is CPU-bound and holds the
+            # GIL, so large batches are spread across processes instead
+            if keep_sources:
+                modules = [_extract_module(path, source) for _, path, _, source in pending]
+            else:
+                modules = map_files(_extract_module, [path for _, path, _, _ in pending])
+            for (file_info, path, stamp, _), module in zip(pending, modules):
+                file_info.module = module
+                _module_cache.put(path, stamp, module)
             
             # Build language info
             total_files = len(project_structure.files)
@@ -259,43 +570,47 @@ class StructureExtractor(BaseTool):
                 )
                 project_structure.languages.append(language_info)
             
-            # Detect entry points
-            project_structure.entry_points = self._detect_entry_points(folder)
+            # Group entry points by pattern, keeping walk order within each
+            entry_points.sort(key=lambda item: item[0])
+            project_structure.entry_points = [rel_path for _, rel_path in entry_points]
+            
+            # Module/Class/Function counts
+            total_classes = 0
+            total_functions = 0
+            for f in project_structure.files:
+                module = f.module
+                if module:
+                    total_classes += len(module.classes)
+                    total_functions += len(module.functions)
+                    for c in module.classes:
+                        total_functions += len(c.methods)
             
-            # Build summary output
-            result = [
-                "=" * 70,
-                "CODEBASE STRUCTURE ANALYSIS",
-                "=" * 70,
-                f"\nRoot Path: {folder_path}",
-                f"Total Files: {len(project_structure.files)}",
-                f"Languages Detected: {len(project_structure.languages)}",
-            ]
+            # Build summary output in a single buffer
+            buf = io.StringIO()
+            write = buf.write
+            write("=" * 70 + "\n")
+            write("CODEBASE STRUCTURE ANALYSIS\n")
+            write("=" * 70 + "\n")
+            write(f"\nRoot Path: {folder_path}\n")
+            write(f"Total Files: {len(project_structure.files)}\n")
+            write(f"Languages Detected: {len(project_structure.languages)}\n")
             
-            result.append("\nLanguages:")
+            write("\nLanguages:\n")
             for lang_info in sorted(project_structure.languages, key=lambda x: x.file_count, reverse=True):
-                result.append(f"  - {lang_info.language.value}: {lang_info.file_count} files, {lang_info.total_lines:,} lines ({lang_info.percentage:.1f}%)")
+                write(f"  - {lang_info.language.value}: {lang_info.file_count} files, {lang_info.total_lines:,} lines ({lang_info.percentage:.1f}%)\n")
             
-            result.append(f"\nEntry Points: {len(project_structure.entry_points)}")
+            write(f"\nEntry Points: {len(project_structure.entry_points)}\n")
             for ep in project_structure.entry_points[:5]:
-                result.append(f"  - {ep}")
-            
-            # Module/Class/Function counts
-            total_classes = sum(len(f.module.classes) if f.module else 0 for f in project_structure.files)
-            total_functions = sum(
-                (len(f.module.functions) if f.module else 0) + 
-                sum(len(c.methods) for c in (f.module.classes if f.module else []))
-                for f in project_structure.files
-            )
+                write(f"  - {ep}\n")
             
-            result.append(f"\nStructural Elements:")
-            result.append(f"  - Classes: {total_classes}")
-            result.append(f"  - Functions/Methods: {total_functions}")
+            write(f"\nStructural Elements:\n")
+            write(f"  - Classes: {total_classes}\n")
+            write(f"  - Functions/Methods: {total_functions}\n")
             
-            result.append("\n" + "=" * 70)
-            result.append("Detailed structure available in structured format.")
+            write("\n" + "=" * 70 + "\n")
+            write("Detailed structure available in structured format.")
             
-            return "\n".join(result)
+            return buf.getvalue()
             
         except Exception as e:
             return f"Error during structure extraction: {str(e)}"